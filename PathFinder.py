@@ -1,54 +1,92 @@
+import heapq
 import math
 from typing import Tuple, List
-from enum import Enum
+from enum import IntEnum
 
+import sys
 import time
-import os
 
+import numpy as np
 
-class Direction(Enum):
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+from PathFinderNumba import (
+    BORDER,
+    DX,
+    DY,
+    EUCLIDEAN,
+    MANHATTAN,
+    _build_move_table,
+    _choose_direction,
+    _simulate,
+    _simulate_table,
+    build_exit_mask,
+    pad_maze,
+)
 
-    @property
-    def opposite(self):
-        opposites = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }
-        return opposites[self]
+
+class Direction(IntEnum):
+    # Values double as indices into DXY and the jitted kernels' direction arrays
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+
+# (dx, dy) movement vector of each direction
+DXY = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Opposites pair up as 0/1 and 2/3, so flipping the low bit reverses a direction.
+# Bind them once as plain attributes instead of computing them on every access.
+for _direction in Direction:
+    _direction.opposite = Direction(_direction ^ 1)
+del _direction
+
+# Direction members by value, cheaper than calling Direction(index)
+_DIRECTIONS = tuple(Direction)
+
+# Distance metrics accepted by Pathfinder, mapped to their kernel codes
+_METRICS = {"euclidean": EUCLIDEAN, "manhattan": MANHATTAN}
 
 
 class Pathfinder:
     """
     Implements ghost pathfinding logic for a Pac-Man-style maze.
-    Ghosts look one step ahead and choose directions based on Euclidean distance
-    to their target tile.
+    Ghosts look one step ahead and choose directions based on the distance to their
+    target tile. By default this is Euclidean distance, as in the arcade game;
+    metric="manhattan" ranks by grid distance instead, which changes the routes
+    ghosts take.
     """
 
-    # Direction preference order for tie-breaking: up, left, down, right
+    # Direction preference order for tie-breaking: up, left, down, right.
+    # PathFinderNumba.PREF_RANK encodes the same order for the jitted kernels.
     DIRECTION_PREFERENCE = [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT]
 
-    def __init__(self, maze: List[List[int]]):
+    __slots__ = ("height", "width", "_maze", "_exit_mask", "_metric", "_move_tables")
+
+    def __init__(self, maze: List[List[int]], metric: str = "euclidean"):
         """
         Initialize the pathfinder with a maze.
 
         Args:
             maze: 2D list where 0 = walkable tile, 1 = wall
+            metric: Distance used to rank test tiles, "euclidean" or "manhattan"
         """
-        self.maze = maze
+        if metric not in _METRICS:
+            raise ValueError(
+                f"Unknown distance metric {metric!r}, expected one of {sorted(_METRICS)}"
+            )
+
         self.height = len(maze)
         self.width = len(maze[0]) if maze else 0
+        self._maze = pad_maze(np.reshape(maze, (self.height, self.width)))
+        self._exit_mask = build_exit_mask(self._maze)
+        self._metric = _METRICS[metric]
+        self._move_tables = {}
 
     def is_valid_tile(self, x: int, y: int) -> bool:
         """Check if a tile position is valid and walkable."""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        return self.maze[y][x] == 0
+        return bool(self._maze[y + BORDER, x + BORDER] == 0)
 
     def get_available_exits(self, x: int, y: int, current_direction: Direction) -> List[Direction]:
         """
@@ -61,21 +99,14 @@ class Pathfinder:
         Returns:
             List of valid directions to move
         """
-        available = []
+        # Beyond the wall border every neighbour is off the maze too
+        if not (-BORDER <= x < self.width + BORDER and -BORDER <= y < self.height + BORDER):
+            return []
 
-        for direction in self.DIRECTION_PREFERENCE:
-            # Skip reverse direction
-            if direction == current_direction.opposite:
-                continue
-
-            # Check if the exit leads to a valid tile
-            dx, dy = direction.value
-            next_x, next_y = x + dx, y + dy
-
-            if self.is_valid_tile(next_x, next_y):
-                available.append(direction)
-
-        return available
+        exits = int(self._exit_mask[y + BORDER, x + BORDER])
+        # Skip reverse direction
+        exits &= ~(1 << current_direction.opposite)
+        return list(_EXITS_BY_MASK[exits])
 
     def euclidean_distance(self, x1: int, y1: int, x2: int, y2: int) -> float:
         """Calculate Euclidean distance between two points."""
@@ -95,47 +126,167 @@ class Pathfinder:
         Returns:
             The direction the ghost should take at the next intersection
         """
-        # Look ahead to the next tile along current direction
-        dx, dy = current_direction.value
-        lookahead_x = ghost_x + dx
-        lookahead_y = ghost_y + dy
-
-        # Get available exits from the lookahead tile
-        available_exits = self.get_available_exits(lookahead_x, lookahead_y, current_direction)
-
-        # If only one exit is available, use it
-        if len(available_exits) == 1:
-            return available_exits[0]
-
-        # If no exits are available (dead end), reverse direction
-        if len(available_exits) == 0:
-            return current_direction.opposite
-
-        # Multiple exits available - evaluate test tiles
-        best_direction = None
-        best_distance = float("inf")
-
-        for direction in available_exits:
-            # Get test tile position (one tile beyond intersection in this direction)
-            test_dx, test_dy = direction.value
-            test_x = lookahead_x + test_dx
-            test_y = lookahead_y + test_dy
-
-            # Calculate distance from test tile to target
-            distance = self.euclidean_distance(test_x, test_y, target_x, target_y)
-
-            # Update best direction if this is better
-            if distance < best_distance:
-                best_distance = distance
-                best_direction = direction
-            elif distance == best_distance:
-                # Tie-breaking: use direction preference order
-                if self.DIRECTION_PREFERENCE.index(direction) < self.DIRECTION_PREFERENCE.index(
-                    best_direction
-                ):
-                    best_direction = direction
-
-        return best_direction
+        direction_index = _choose_direction(
+            self._exit_mask,
+            ghost_x,
+            ghost_y,
+            int(current_direction),
+            target_x,
+            target_y,
+            self._metric,
+        )
+        return _DIRECTIONS[direction_index]
+
+    def build_move_table(self, target_x: int, target_y: int) -> np.ndarray:
+        """
+        Precompute choose_direction for every tile and direction for a fixed target.
+
+        Tables are cached per target, so repeated simulations towards the same
+        tile only pay for the table once.
+
+        Args:
+            target_x, target_y: Target tile coordinates
+
+        Returns:
+            Read-only (height + 2 * BORDER, width + 2 * BORDER, 4) int8 array
+            mapping [y + BORDER, x + BORDER, direction] to the next direction's
+            value, or -1 on the target tile
+        """
+        table = self._move_tables.get((target_x, target_y))
+        if table is None:
+            table = _build_move_table(self._exit_mask, target_x, target_y, self._metric)
+            table.flags.writeable = False
+            self._move_tables[(target_x, target_y)] = table
+        return table
+
+    def simulate_many(
+        self,
+        ghost_xs: np.ndarray,
+        ghost_ys: np.ndarray,
+        directions: np.ndarray,
+        target_x: int,
+        target_y: int,
+        max_steps: int = 100,
+    ) -> np.ndarray:
+        """
+        Simulate many ghosts chasing the same target, stepping all of them at once.
+
+        Each step is one fancy-indexed read of the move table for every ghost. Ghosts
+        that reach the target stay there, and the simulation stops once all have.
+        Ghosts starting on walkable tiles follow the same paths as simulate_ghost_path;
+        like simulate_ghost_path_table, a ghost that leaves the table stops moving.
+
+        Args:
+            ghost_xs, ghost_ys: Starting tiles of the ghosts
+            directions: Direction of each ghost, as Direction members or their int values
+            target_x, target_y: Target tile coordinates
+            max_steps: Maximum number of steps to simulate
+
+        Returns:
+            (steps + 1, ghosts, 2) int16 array of every ghost's (x, y) after each step
+        """
+        table = self.build_move_table(target_x, target_y)
+        table_height, table_width = table.shape[:2]
+        xs = np.array(ghost_xs, dtype=np.intp)
+        ys = np.array(ghost_ys, dtype=np.intp)
+        dirs = np.array(directions, dtype=np.intp)
+
+        # The start tiles are always recorded, even when no steps are allowed
+        max_steps = max(max_steps, 0)
+        positions = np.empty((max_steps + 1, len(xs), 2), dtype=np.int16)
+        positions[0, :, 0] = xs
+        positions[0, :, 1] = ys
+        steps = 0
+
+        while steps < max_steps:
+            table_xs = xs + BORDER
+            table_ys = ys + BORDER
+            on_table = (table_xs >= 0) & (table_xs < table_width)
+            on_table &= (table_ys >= 0) & (table_ys < table_height)
+            next_dirs = table[
+                np.clip(table_ys, 0, table_height - 1), np.clip(table_xs, 0, table_width - 1), dirs
+            ]
+            # The table holds -1 on the target tile, so arrived ghosts stop moving
+            moving = on_table & (next_dirs >= 0)
+            if not moving.any():
+                break
+
+            dirs = np.where(moving, next_dirs, dirs)
+            xs += np.where(moving, DX[dirs], 0)
+            ys += np.where(moving, DY[dirs], 0)
+
+            steps += 1
+            positions[steps, :, 0] = xs
+            positions[steps, :, 1] = ys
+
+        return positions[: steps + 1]
+
+    def astar(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Find a shortest path between two tiles using A* with a Manhattan heuristic.
+
+        Unlike choose_direction, the search may reverse, so this gives the optimal
+        route rather than the one a ghost would actually follow.
+
+        Args:
+            start: (x, y) tile to start from
+            goal: (x, y) tile to reach
+
+        Returns:
+            List of tiles from start to goal inclusive, or an empty list if the
+            goal cannot be reached
+        """
+        if not (self.is_valid_tile(*start) and self.is_valid_tile(*goal)):
+            return []
+
+        start_x, start_y = start
+        goal_x, goal_y = goal
+
+        closed = np.zeros((self.height, self.width), dtype=bool)
+        cost_so_far = np.full((self.height, self.width), np.iinfo(np.int32).max, dtype=np.int32)
+        # Index of the direction each tile was entered from, for path reconstruction
+        came_from = np.full((self.height, self.width), -1, dtype=np.int8)
+
+        cost_so_far[start_y, start_x] = 0
+        open_heap = [(abs(start_x - goal_x) + abs(start_y - goal_y), 0, start_x, start_y)]
+
+        while open_heap:
+            _, cost, x, y = heapq.heappop(open_heap)
+            if closed[y, x]:
+                continue
+            closed[y, x] = True
+
+            if x == goal_x and y == goal_y:
+                break
+
+            exits = int(self._exit_mask[y + BORDER, x + BORDER])
+            for direction in _DIRECTIONS:
+                if not exits >> direction & 1:
+                    continue
+
+                dx, dy = DXY[direction]
+                next_x, next_y = x + dx, y + dy
+                next_cost = cost + 1
+                if closed[next_y, next_x] or next_cost >= cost_so_far[next_y, next_x]:
+                    continue
+
+                cost_so_far[next_y, next_x] = next_cost
+                came_from[next_y, next_x] = direction
+                estimate = next_cost + abs(next_x - goal_x) + abs(next_y - goal_y)
+                heapq.heappush(open_heap, (estimate, next_cost, next_x, next_y))
+        else:
+            return []
+
+        # Walk the parent directions back from the goal
+        path = [(goal_x, goal_y)]
+        x, y = goal_x, goal_y
+        while (x, y) != (start_x, start_y):
+            dx, dy = DXY[came_from[y, x]]
+            x, y = x - dx, y - dy
+            path.append((x, y))
+
+        path.reverse()
+        return path
 
     def get_next_position(self, x: int, y: int, direction: Direction) -> Tuple[int, int]:
         """
@@ -148,29 +299,37 @@ class Pathfinder:
         Returns:
             Tuple of (next_x, next_y)
         """
-        dx, dy = direction.value
+        dx, dy = DXY[direction]
         return (x + dx, y + dy)
 
 
-def draw_maze(maze, path, ghost, target):
-    path_set = set(path)
+# Exits for every possible exit bitmask, in direction preference order
+_EXITS_BY_MASK = tuple(
+    tuple(
+        direction
+        for direction in Pathfinder.DIRECTION_PREFERENCE
+        if mask >> direction & 1
+    )
+    for mask in range(16)
+)
+
 
-    for y, row in enumerate(maze):
-        line = ""
-        for x, cell in enumerate(row):
-            pos = (x, y)
+# Floor and wall glyphs, indexed by whether the tile is a wall
+_TILE_GLYPHS = np.array(["⬜ ", "🟦 "], dtype=object)
 
-            if pos == ghost:
-                line += "👻 "
-            elif pos == target:
-                line += "🎯 "
-            elif pos in path_set:
-                line += "🟩 "
-            elif cell == 1:
-                line += "🟦 "
-            else:
-                line += "⬜ "
-        print(line)
+
+def draw_maze(walls, visited_mask, ghost, target):
+    """Print the maze from its boolean wall grid, marking visited tiles, the ghost and the target."""
+    height, width = walls.shape
+    glyphs = _TILE_GLYPHS[walls.astype(np.intp)]
+    glyphs[visited_mask] = "🟩 "
+
+    # Tunnel exits can put the ghost just outside the maze; those tiles are not drawn
+    for (x, y), glyph in ((target, "🎯 "), (ghost, "👻 ")):
+        if 0 <= x < width and 0 <= y < height:
+            glyphs[y, x] = glyph
+
+    print("\n".join("".join(row) for row in glyphs))
 
 
 def animate_ghost(
@@ -186,14 +345,18 @@ def animate_ghost(
 ):
     x, y = ghost_x, ghost_y
     direction = current_direction
-    visited = []
+    visited_mask = np.zeros((pathfinder.height, pathfinder.width), dtype=bool)
+    # The maze never changes, so the wall grid is built once rather than every frame
+    walls = np.asarray(maze) == 1
 
     for step in range(max_steps):
-        visited.append((x, y))
+        if 0 <= x < pathfinder.width and 0 <= y < pathfinder.height:
+            visited_mask[y, x] = True
 
-        os.system("cls" if os.name == "nt" else "clear")
+        # Move the cursor home and clear the screen without spawning a shell
+        sys.stdout.write("\x1b[H\x1b[2J")
         print(f"Step {step} | Ghost: ({x}, {y}) | Moving: {direction.name}")
-        draw_maze(maze, visited, (x, y), (target_x, target_y))
+        draw_maze(walls, visited_mask, (x, y), (target_x, target_y))
 
         if (x, y) == (target_x, target_y):
             print("\nTarget reached!")
@@ -220,20 +383,48 @@ def simulate_ghost_path(
     target_y: int,
     max_steps: int = 100,
 ):
-    path = [(ghost_x, ghost_y)]
-    x, y = ghost_x, ghost_y
-    direction = current_direction
+    """Simulate a ghost chasing a target; returns the visited tiles as an (n, 2) int16 array."""
+    return _simulate(
+        pathfinder._exit_mask,
+        ghost_x,
+        ghost_y,
+        int(current_direction),
+        target_x,
+        target_y,
+        pathfinder._metric,
+        max_steps,
+    )
 
-    for _ in range(max_steps):
-        if (x, y) == (target_x, target_y):
-            break
 
-        direction = pathfinder.choose_direction(x, y, direction, target_x, target_y)
+def simulate_ghost_path_astar(
+    pathfinder: Pathfinder,
+    ghost_x: int,
+    ghost_y: int,
+    target_x: int,
+    target_y: int,
+    max_steps: int = 100,
+):
+    """Shortest-path counterpart of simulate_ghost_path, for comparing against the greedy ghost."""
+    path = pathfinder.astar((ghost_x, ghost_y), (target_x, target_y)) or [(ghost_x, ghost_y)]
+    return np.array(path[: max_steps + 1], dtype=np.int16)
 
-        x, y = pathfinder.get_next_position(x, y, direction)
-        path.append((x, y))
 
-    return path
+def simulate_ghost_path_table(
+    table: np.ndarray,
+    ghost_x: int,
+    ghost_y: int,
+    current_direction: Direction,
+    max_steps: int = 100,
+):
+    """
+    Replay a table from Pathfinder.build_move_table.
+
+    Gives the same path as simulate_ghost_path for a ghost starting on a walkable
+    tile, but each step is a single table read. Such a ghost never strays more than
+    two tiles outside the maze, well within the table's border; a ghost that does
+    leave the table ends the simulation early.
+    """
+    return _simulate_table(table, ghost_x, ghost_y, int(current_direction), max_steps)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,177 @@
+"""
+Numba-compiled kernels behind Pathfinder's hot paths.
+
+Directions are passed as their Direction values so the kernels can index
+constant arrays: 0 = UP, 1 = DOWN, 2 = LEFT, 3 = RIGHT.
+
+Kernels take the maze from pad_maze(), surrounded by a BORDER-tile wall ring, so
+tile (x, y) lives at maze[y + BORDER, x + BORDER] and only a tile beyond the
+border needs a bounds check.
+Since the maze is static, the kernels only read the per-tile exit masks from
+build_exit_mask(): bit d is set when the neighbour in direction d is walkable.
+"""
+
+import numpy as np
+from numba import njit
+
+DX = np.array((0, 0, -1, 1), dtype=np.int64)
+DY = np.array((-1, 1, 0, 0), dtype=np.int64)
+OPP = np.array((1, 0, 3, 2), dtype=np.int64)
+
+# Tie-breaking rank per direction, mirroring Pathfinder.DIRECTION_PREFERENCE:
+# up, left, down, right
+PREF_RANK = np.array((0, 2, 1, 3), dtype=np.int64)
+# Direction for each rank, the inverse permutation of PREF_RANK
+PREF_ORDER = np.argsort(PREF_RANK).astype(np.int64)
+
+# Distance metrics used to rank the test tiles
+MANHATTAN = 0
+EUCLIDEAN = 1
+
+# A ghost can stand one tile outside the maze (the tunnel exits), its lookahead
+# tile is one further out and that tile's neighbours one further again.
+BORDER = 3
+
+
+def pad_maze(maze) -> np.ndarray:
+    """Copy a 2D maze into a contiguous uint8 array surrounded by a wall border."""
+    maze = np.asarray(maze, dtype=np.uint8)
+    padded = np.ones((maze.shape[0] + 2 * BORDER, maze.shape[1] + 2 * BORDER), dtype=np.uint8)
+    padded[BORDER:-BORDER, BORDER:-BORDER] = maze
+    return padded
+
+
+def build_exit_mask(maze: np.ndarray) -> np.ndarray:
+    """Compute the exit bitmask of every tile of a padded maze."""
+    walkable = (maze == 0).astype(np.uint8)
+    exit_mask = np.zeros_like(walkable)
+
+    # Shift the walkability grid one tile per direction and OR it into that direction's bit
+    exit_mask[1:, :] |= walkable[:-1, :]  # UP
+    exit_mask[:-1, :] |= walkable[1:, :] << 1  # DOWN
+    exit_mask[:, 1:] |= walkable[:, :-1] << 2  # LEFT
+    exit_mask[:, :-1] |= walkable[:, 1:] << 3  # RIGHT
+
+    return exit_mask
+
+
+@njit(cache=True)
+def _choose_direction(exit_mask, ghost_x, ghost_y, dir_idx, target_x, target_y, metric):
+    """Jitted counterpart of Pathfinder.choose_direction working on direction indices."""
+    lookahead_x = ghost_x + DX[dir_idx]
+    lookahead_y = ghost_y + DY[dir_idx]
+    reverse = OPP[dir_idx]
+
+    # Beyond the border every neighbour is off the maze too, so it is a dead end
+    mask_x = lookahead_x + BORDER
+    mask_y = lookahead_y + BORDER
+    if mask_x < 0 or mask_x >= exit_mask.shape[1] or mask_y < 0 or mask_y >= exit_mask.shape[0]:
+        return reverse
+
+    # Exits from the lookahead tile, excluding the reverse direction
+    exits = exit_mask[mask_y, mask_x] & ~(1 << reverse)
+
+    # If no exits are available (dead end), reverse direction
+    if exits == 0:
+        return reverse
+
+    # Evaluate the test tile beyond every exit in one pass; a lone exit simply wins.
+    # Each candidate is packed into distance * 4 + rank, so a single min() picks the
+    # closest tile and breaks ties by preference, and the winner's rank sits in the
+    # low two bits.
+    best_key = np.iinfo(np.int64).max
+    for direction in range(4):
+        if not exits >> direction & 1:
+            continue
+
+        dist_x = lookahead_x + DX[direction] - target_x
+        dist_y = lookahead_y + DY[direction] - target_y
+        if metric == MANHATTAN:
+            distance = abs(dist_x) + abs(dist_y)
+        else:
+            # Only the ordering matters, so squared Euclidean distance is enough
+            distance = dist_x * dist_x + dist_y * dist_y
+
+        best_key = min(best_key, distance * 4 + PREF_RANK[direction])
+
+    return PREF_ORDER[best_key & 3]
+
+
+@njit(cache=True)
+def _simulate(exit_mask, ghost_x, ghost_y, dir_idx, target_x, target_y, metric, max_steps):
+    """Jitted counterpart of simulate_ghost_path; returns the visited tiles as an (n, 2) array."""
+    # The start tile is always recorded, even when no steps are allowed
+    max_steps = max(max_steps, 0)
+    path = np.empty((max_steps + 1, 2), dtype=np.int16)
+    path[0, 0] = ghost_x
+    path[0, 1] = ghost_y
+    length = 1
+
+    x, y = ghost_x, ghost_y
+    for _ in range(max_steps):
+        if x == target_x and y == target_y:
+            break
+
+        dir_idx = _choose_direction(exit_mask, x, y, dir_idx, target_x, target_y, metric)
+
+        x += DX[dir_idx]
+        y += DY[dir_idx]
+        path[length, 0] = x
+        path[length, 1] = y
+        length += 1
+
+    return path[:length]
+
+
+@njit(cache=True)
+def _build_move_table(exit_mask, target_x, target_y, metric):
+    """
+    Tabulate _choose_direction for every tile and direction; -1 marks the target tile.
+
+    The table spans the same padded extent as exit_mask, so tile (x, y) lives at
+    table[y + BORDER, x + BORDER] and ghosts leaving through the tunnels stay on it.
+    """
+    height, width = exit_mask.shape
+    table = np.empty((height, width, 4), dtype=np.int8)
+    for mask_y in range(height):
+        for mask_x in range(width):
+            x = mask_x - BORDER
+            y = mask_y - BORDER
+            for dir_idx in range(4):
+                if x == target_x and y == target_y:
+                    table[mask_y, mask_x, dir_idx] = -1
+                else:
+                    table[mask_y, mask_x, dir_idx] = _choose_direction(
+                        exit_mask, x, y, dir_idx, target_x, target_y, metric
+                    )
+    return table
+
+
+@njit(cache=True)
+def _simulate_table(table, ghost_x, ghost_y, dir_idx, max_steps):
+    """Replay a move table from _build_move_table; returns the visited tiles as an (n, 2) array."""
+    height, width = table.shape[0], table.shape[1]
+    # The start tile is always recorded, even when no steps are allowed
+    max_steps = max(max_steps, 0)
+    path = np.empty((max_steps + 1, 2), dtype=np.int16)
+    path[0, 0] = ghost_x
+    path[0, 1] = ghost_y
+    length = 1
+
+    x, y = ghost_x, ghost_y
+    for _ in range(max_steps):
+        mask_x = x + BORDER
+        mask_y = y + BORDER
+        if mask_x < 0 or mask_x >= width or mask_y < 0 or mask_y >= height:
+            break
+        dir_idx = table[mask_y, mask_x, dir_idx]
+        if dir_idx < 0:
+            break
+
+        x += DX[dir_idx]
+        y += DY[dir_idx]
+        path[length, 0] = x
+        path[length, 1] = y
+        length += 1
+
+    return path[:length]
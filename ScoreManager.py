@@ -1,4 +1,10 @@
+# Ghost points for combo counts 1..4; later ghosts keep scoring the last entry
+_GHOST_SCORES = (200, 400, 800, 1600)
+
+
 class ScoreManager:
+    __slots__ = ("score", "ghost_eaten_combo")
+
     def __init__(self):
         self.score = 0
         self.ghost_eaten_combo = 1
@@ -15,7 +21,7 @@ class ScoreManager:
         self.ghost_eaten_combo = 1  # The combo should reset when a power pellet is eaten
 
     def add_ghost_score(self):
-        self.score += (2**self.ghost_eaten_combo) * 100  # 200 -> 400 -> 800 -> 1600
+        self.score += _GHOST_SCORES[min(self.ghost_eaten_combo, len(_GHOST_SCORES)) - 1]
         self.ghost_eaten_combo += 1
 
 
@@ -1,7 +1,17 @@
 import math
+
+import numpy as np
 import pytest
 
-from PathFinder import Pathfinder, Direction
+from PathFinder import (
+    DXY,
+    Pathfinder,
+    Direction,
+    simulate_ghost_path,
+    simulate_ghost_path_astar,
+    simulate_ghost_path_table,
+)
+from PathFinderNumba import BORDER, PREF_ORDER, PREF_RANK
 
 
 # -------------------------
@@ -21,6 +31,28 @@ def simple_maze():
     ]
 
 
+@pytest.fixture
+def open_maze():
+    return [
+        [1, 1, 1, 1, 1, 1, 1],
+        [1, 0, 0, 0, 0, 0, 1],
+        [1, 0, 0, 0, 0, 0, 1],
+        [1, 0, 0, 0, 0, 0, 1],
+        [1, 1, 1, 1, 1, 1, 1],
+    ]
+
+
+@pytest.fixture
+def open_edge_maze():
+    # No outer wall, so ghosts can walk off the grid like through a tunnel
+    return [
+        [1, 1, 0],
+        [0, 1, 0],
+        [1, 0, 0],
+        [0, 0, 1],
+    ]
+
+
 @pytest.fixture
 def pathfinder(simple_maze):
     return Pathfinder(simple_maze)
@@ -39,10 +71,15 @@ def test_direction_opposites():
 
 
 def test_direction_vectors():
-    assert Direction.UP.value == (0, -1)
-    assert Direction.DOWN.value == (0, 1)
-    assert Direction.LEFT.value == (-1, 0)
-    assert Direction.RIGHT.value == (1, 0)
+    assert DXY[Direction.UP] == (0, -1)
+    assert DXY[Direction.DOWN] == (0, 1)
+    assert DXY[Direction.LEFT] == (-1, 0)
+    assert DXY[Direction.RIGHT] == (1, 0)
+
+
+def test_kernel_preference_matches_direction_preference():
+    assert [PREF_ORDER[rank] for rank in range(4)] == list(Pathfinder.DIRECTION_PREFERENCE)
+    assert [PREF_RANK[d] for d in Pathfinder.DIRECTION_PREFERENCE] == [0, 1, 2, 3]
 
 
 # -------------------------
@@ -81,6 +118,11 @@ def test_available_exits_excludes_walls_and_reverse(pathfinder):
     assert exits == [Direction.UP]
 
 
+@pytest.mark.parametrize("x,y", [(10, 10), (-10, 1), (1, -4), (8, 1)])
+def test_available_exits_far_outside_maze(pathfinder, x, y):
+    assert pathfinder.get_available_exits(x, y, current_direction=Direction.UP) == []
+
+
 def test_available_exits_order_respects_preference(pathfinder):
     exits = pathfinder.get_available_exits(x=1, y=3, current_direction=Direction.UP)
 
@@ -124,6 +166,18 @@ def test_choose_direction_dead_end_reverses(pathfinder):
     assert direction == Direction.DOWN
 
 
+@pytest.mark.parametrize(
+    "ghost_x,ghost_y,direction",
+    [
+        (10, 10, Direction.LEFT),
+        (-8, 2, Direction.RIGHT),
+        (2, -20, Direction.DOWN),
+    ],
+)
+def test_choose_direction_far_outside_maze_reverses(pathfinder, ghost_x, ghost_y, direction):
+    assert pathfinder.choose_direction(ghost_x, ghost_y, direction, 3, 3) == direction.opposite
+
+
 def test_choose_direction_minimizes_distance(pathfinder):
     # Intersection where DOWN is closer to target than RIGHT
     direction = pathfinder.choose_direction(
@@ -142,6 +196,29 @@ def test_choose_direction_tie_breaker_uses_preference(pathfinder):
     assert direction == Direction.UP
 
 
+def test_choose_direction_uses_euclidean_by_default(open_maze):
+    # RIGHT (2,2) is sqrt(5) from the target, closer than UP (1,1) at 3
+    direction = Pathfinder(open_maze).choose_direction(
+        ghost_x=1, ghost_y=3, current_direction=Direction.UP, target_x=4, target_y=1
+    )
+
+    assert direction == Direction.RIGHT
+
+
+def test_choose_direction_manhattan_metric(open_maze):
+    # Test tiles UP (1,1) and RIGHT (2,2) are both 3 steps from the target
+    direction = Pathfinder(open_maze, metric="manhattan").choose_direction(
+        ghost_x=1, ghost_y=3, current_direction=Direction.UP, target_x=4, target_y=1
+    )
+
+    assert direction == Direction.UP
+
+
+def test_unknown_metric_is_rejected(simple_maze):
+    with pytest.raises(ValueError):
+        Pathfinder(simple_maze, metric="chebyshev")
+
+
 # -------------------------
 # Movement tests
 # -------------------------
@@ -174,7 +251,7 @@ def test_full_decision_sequence(pathfinder):
         next_direction = pathfinder.choose_direction(ghost_x, ghost_y, direction, target_x, target_y)
 
         # Lookahead tile
-        dx, dy = direction.value
+        dx, dy = DXY[direction]
         lookahead_x = ghost_x + dx
         lookahead_y = ghost_y + dy
 
@@ -185,3 +262,144 @@ def test_full_decision_sequence(pathfinder):
         # Apply movement
         ghost_x, ghost_y = pathfinder.get_next_position(ghost_x, ghost_y, next_direction)
         direction = next_direction
+
+
+def test_simulate_ghost_path_stops_at_target(pathfinder):
+    path = simulate_ghost_path(pathfinder, 1, 1, Direction.RIGHT, 2, 1)
+
+    assert path.dtype == np.int16
+    assert path.tolist() == [[1, 1], [2, 1]]
+
+
+@pytest.mark.parametrize("max_steps", [0, -1, -3])
+def test_simulate_ghost_path_without_steps_returns_start(pathfinder, max_steps):
+    path = simulate_ghost_path(pathfinder, 1, 1, Direction.UP, 3, 3, max_steps=max_steps)
+
+    assert path.tolist() == [[1, 1]]
+
+
+def test_simulate_ghost_path_respects_max_steps(pathfinder):
+    path = simulate_ghost_path(pathfinder, 1, 1, Direction.RIGHT, 3, 3, max_steps=5)
+
+    assert path[0].tolist() == [1, 1]
+    assert len(path) <= 6
+
+
+# -------------------------
+# Move table tests
+# -------------------------
+
+
+def test_move_table_matches_choose_direction(pathfinder):
+    table = pathfinder.build_move_table(3, 3)
+
+    assert table.shape == (5 + 2 * BORDER, 5 + 2 * BORDER, 4)
+    for direction in Direction:
+        expected = pathfinder.choose_direction(1, 1, direction, 3, 3)
+        assert table[1 + BORDER, 1 + BORDER, direction] == expected
+
+
+def test_move_table_marks_target_and_is_cached(pathfinder):
+    table = pathfinder.build_move_table(3, 3)
+
+    assert (table[3 + BORDER, 3 + BORDER] == -1).all()
+    assert pathfinder.build_move_table(3, 3) is table
+
+
+def test_simulate_ghost_path_table_matches_simulation(pathfinder):
+    table = pathfinder.build_move_table(3, 3)
+
+    for direction in Direction:
+        expected = simulate_ghost_path(pathfinder, 1, 3, direction, 3, 3, max_steps=20)
+        path = simulate_ghost_path_table(table, 1, 3, direction, max_steps=20)
+        assert np.array_equal(path, expected)
+
+
+def test_simulate_ghost_path_table_follows_ghost_off_the_grid(open_edge_maze):
+    pathfinder = Pathfinder(open_edge_maze, metric="euclidean")
+    table = pathfinder.build_move_table(1, 2)
+
+    expected = simulate_ghost_path(pathfinder, 2, 0, Direction.LEFT, 1, 2, max_steps=20)
+    path = simulate_ghost_path_table(table, 2, 0, Direction.LEFT, max_steps=20)
+
+    assert (expected[:, 0] == 3).any()
+    assert np.array_equal(path, expected)
+
+
+@pytest.mark.parametrize("max_steps", [0, -1, -3])
+def test_simulate_ghost_path_table_without_steps_returns_start(pathfinder, max_steps):
+    table = pathfinder.build_move_table(3, 3)
+
+    path = simulate_ghost_path_table(table, 1, 1, Direction.UP, max_steps=max_steps)
+
+    assert path.tolist() == [[1, 1]]
+
+
+def test_simulate_many_matches_individual_simulations(pathfinder):
+    starts = [(1, 1, Direction.RIGHT), (1, 3, Direction.UP), (3, 1, Direction.LEFT)]
+    xs, ys, directions = zip(*starts)
+
+    positions = pathfinder.simulate_many(xs, ys, directions, 3, 3, max_steps=20)
+
+    assert positions.dtype == np.int16
+    for ghost, (x, y, direction) in enumerate(starts):
+        expected = simulate_ghost_path(pathfinder, x, y, direction, 3, 3, max_steps=20)
+        trajectory = positions[:, ghost]
+        # Ghosts that arrive early stay on the target
+        assert np.array_equal(trajectory[: len(expected)], expected)
+        assert (trajectory[len(expected) :] == expected[-1]).all()
+
+
+def test_simulate_many_follows_ghost_off_the_grid(open_edge_maze):
+    pathfinder = Pathfinder(open_edge_maze, metric="euclidean")
+
+    positions = pathfinder.simulate_many([2], [0], [Direction.LEFT], 1, 2, max_steps=20)
+    expected = simulate_ghost_path(pathfinder, 2, 0, Direction.LEFT, 1, 2, max_steps=20)
+
+    assert (expected[:, 0] == 3).any()
+    assert np.array_equal(positions[:, 0], expected)
+
+
+def test_simulate_many_stops_ghosts_outside_the_table(pathfinder):
+    positions = pathfinder.simulate_many([-20, 1], [0, 1], [Direction.LEFT, Direction.RIGHT], 3, 3)
+
+    assert (positions[:, 0] == [-20, 0]).all()
+    assert positions[-1, 1].tolist() != [1, 1]
+
+
+@pytest.mark.parametrize("max_steps", [0, -1, -3])
+def test_simulate_many_without_steps_returns_starts(pathfinder, max_steps):
+    positions = pathfinder.simulate_many(
+        [1, 1], [1, 3], [Direction.RIGHT, Direction.UP], 3, 3, max_steps=max_steps
+    )
+
+    assert positions.tolist() == [[[1, 1], [1, 3]]]
+
+
+# -------------------------
+# A* tests
+# -------------------------
+
+
+def test_astar_finds_shortest_path(pathfinder):
+    path = pathfinder.astar((1, 1), (3, 3))
+
+    assert path[0] == (1, 1)
+    assert path[-1] == (3, 3)
+    assert len(path) == 5
+    for x, y in path:
+        assert pathfinder.is_valid_tile(x, y)
+
+
+def test_astar_same_tile(pathfinder):
+    assert pathfinder.astar((1, 1), (1, 1)) == [(1, 1)]
+
+
+def test_astar_unreachable_goal(pathfinder):
+    assert pathfinder.astar((1, 1), (2, 2)) == []
+
+
+def test_simulate_ghost_path_astar_respects_max_steps(pathfinder):
+    path = simulate_ghost_path_astar(pathfinder, 1, 1, 3, 3, max_steps=2)
+
+    assert path.tolist() == [list(tile) for tile in pathfinder.astar((1, 1), (3, 3))[:3]]
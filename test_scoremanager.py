@@ -106,7 +106,7 @@ def test_full_ghost_combo_sequence(score_manager):
 
 
 def test_ghost_score_formula(score_manager):
-    # Explicitly validate the formula: (2 ** combo) * 100
+    # Explicitly validate the per-ghost scores: 200 -> 400 -> 800 -> 1600
     expected_scores = [200, 400, 800, 1600]
 
     for expected in expected_scores:
@@ -116,6 +116,17 @@ def test_ghost_score_formula(score_manager):
         assert score_manager.score - previous_score == expected
 
 
+def test_ghost_score_caps_at_1600(score_manager):
+    for _ in range(4):
+        score_manager.add_ghost_score()
+
+    score_manager.add_ghost_score()
+    score_manager.add_ghost_score()
+
+    assert score_manager.score == 3000 + 1600 + 1600
+    assert score_manager.ghost_eaten_combo == 7
+
+
 # -------------------------
 # Sequencing & integration behavior
 # -------------------------